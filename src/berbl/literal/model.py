@@ -232,7 +232,7 @@ class Model:
             # A submodel's prediction variance.
             var = 2 * self.b_tau_[k] / (self.a_tau_[k] - 1) * (
                 1 + np.sum(X * X @ self.Lambda_1_[k], axis=1))
-            y_var[k] = var.reshape((len(X), self.Dy_)).repeat(self.Dy_, axis=1)
+            y_var[k] = np.broadcast_to(var[:, np.newaxis], (N, self.Dy_))
 
         return y_var
 
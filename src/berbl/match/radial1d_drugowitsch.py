@@ -118,7 +118,7 @@ class RadialMatch1D():
         if self.has_bias:
             assert X.shape[
                 1] == 2, f"X should have 2 columns but has {X.shape[1]}"
-            X = X.T[1:].T
+            X = X[:, 1:]
 
         return self._match_wo_bias(X)
 
@@ -136,21 +136,80 @@ class RadialMatch1D():
         :returns: matching vector ``(N)`` of this matching function (i.e. of
             this rule)
         """
-        # We have to clip this so we don't return 0 here (0 should never be
-        # returned because every match function matches everywhere at least a
-        # little bit). Also, we clip from above such that this function never
-        # returns a value larger than 1 (it's a probability, after all), meaning
-        # that m should not be larger than 0.
-        m_min = np.log(np.finfo(None).tiny)
-        m_max = 0
-        # NOTE If ``self.sigma_2()`` is very close to 0 then the next line may
-        # result in ``nan`` due to ``-inf * 0 = nan``. However, if we use ``b``
-        # to set ``self.sigma_2()`` this problem will not occur.
-        m = np.clip(-0.5 / self.sigma_2() * (X - self.mu())**2, m_min, m_max)
-        return np.exp(m)
+        m = _log_match(X, self.mu(), self.sigma_2())
+        return np.exp(m, out=m)
+
+    @classmethod
+    def match_batch(cls, matchs, X: np.ndarray, out: np.ndarray = None):
+        """
+        Compute the matching vectors of several ``RadialMatch1D`` at once
+        (i.e. their matching matrix), evaluating all of them in a single
+        vectorized pass over the input instead of one pass per matching
+        function.
+
+        Parameters
+        ----------
+        matchs : list of ``RadialMatch1D``
+            Matching functions to evaluate; all of them have to agree on
+            ``has_bias``.
+        X : array of shape ``(N, 1)`` or ``(N, 2)`` if ``has_bias``
+            Input matrix.
+        out : array of shape ``(N, K)`` or ``None``
+            If given, the matching matrix is written into this array.
+
+        Returns
+        -------
+        array of shape ``(N, K)``
+            Matching matrix; column ``k`` is equal to ``matchs[k].match(X)``.
+        """
+        has_bias = {m.has_bias for m in matchs}
+        if len(has_bias) > 1:
+            raise ValueError("All matching functions have to agree on "
+                             "has_bias")
+
+        if has_bias == {True}:
+            assert X.shape[
+                1] == 2, f"X should have 2 columns but has {X.shape[1]}"
+            X = X[:, 1:]
+
+        mu = np.array([m.mu() for m in matchs])
+        sigma_2 = np.array([m.sigma_2() for m in matchs])
+
+        # Same as in ``_match_wo_bias`` but broadcast over all the matching
+        # functions.
+        out = _log_match(X, mu, sigma_2, out=out)
+        return np.exp(out, out=out)
 
     def plot(self, l, u, ax, **kwargs):
         X = np.arange(l, u, 0.01)[:, np.newaxis]
         M = self._match_wo_bias(X)
         ax.plot(X, M, **kwargs)
         ax.axvline(self.mu(), color=kwargs["color"])
+
+
+
+# NOTE We do not expose the logarithm of the matching vector. Its only consumer
+# would be ``Mixing`` (which needs ``log M``), but ``Mixing`` takes the matching
+# matrix from the fitted rules' ``m_`` (which the rules need in non-log form
+# anyway); computing log matches there would thus add a pass over the data
+# instead of saving an ``exp``/``log`` round trip.
+def _log_match(X: np.ndarray, mu, sigma_2, out: np.ndarray = None):
+    """
+    Natural logarithm of the radial basis function–based matching function
+    (clamped such that its ``exp`` is never 0); written into ``out`` if given.
+
+    ``mu`` and ``sigma_2`` may be arrays of shape ``(K)`` in which case they are
+    broadcast against the single column of ``X`` (i.e. the result has shape
+    ``(N, K)``).
+    """
+    # NOTE If ``sigma_2`` is very close to 0 then this may result in ``nan``
+    # due to ``-inf * 0 = nan``. However, if we use ``b`` to set ``sigma_2``
+    # this problem will not occur.
+    out = np.subtract(X, mu, out=out)
+    np.square(out, out=out)
+    out *= -0.5 / sigma_2
+    # We have to clip this so we don't return 0 in the end (0 should never be
+    # returned because every match function matches everywhere at least a
+    # little bit). We don't have to clip from above since this is never larger
+    # than 0 (i.e. its exp is never larger than 1).
+    return np.maximum(out, np.log(np.finfo(out.dtype).tiny), out=out)
@@ -92,7 +92,7 @@ class SoftInterval1D():
         if self.has_bias:
             assert X.shape[
                 1] == 2, f"X should have 2 columns but has {X.shape[1]}"
-            X = X.T[1:].T
+            X = X[:, 1:]
 
         return self._match_wo_bias(X)
 
@@ -116,9 +116,6 @@ class SoftInterval1D():
         if sigma2 == 0:
             return np.where(X == self.u, 1, np.finfo(None).tiny)
         else:
-            # We have to clip this so we don't return 0 here (0 should never be
-            # returned because every match function matches everywhere at least a
-            # little bit).
             conds = [
                 X < self.l,
                 X > self.u,
@@ -129,9 +126,11 @@ class SoftInterval1D():
             ]
             default = 1
             m = np.select(conds, cases, default=default)
-            m_min = np.finfo(None).tiny
-            m_max = 1
-            return np.clip(m, m_min, m_max)
+            # We have to clip this so we don't return 0 here (0 should never
+            # be returned because every match function matches everywhere at
+            # least a little bit). Since all cases are at most 1, we don't
+            # have to clip from above.
+            return np.maximum(m, np.finfo(m.dtype).tiny, out=m)
 
     def plot(self, l, u, ax, **kwargs):
         X = np.arange(l, u, 0.01)[:, np.newaxis]
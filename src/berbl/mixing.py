@@ -67,14 +67,26 @@ class Mixing:
         self.random_state = random_state
         self.K = len(self.rules)
 
-    def fit(self, X, y):
+    def fit(self, X, y, M=None):
         """
         Fits mixing weights for this mixing weight model's set of rules to the
         provided data.
+
+        Parameters
+        ----------
+        X : array of shape (N, DX)
+            Input matrix.
+        y : array of shape (N, Dy)
+            Output matrix.
+        M : array of shape (N, K) or None
+            The rules' matching matrix for ``X`` if already at hand (e.g. from
+            fitting the rules); otherwise, it is assembled from the rules'
+            ``m_``.
         """
         Phi = check_phi(self.phi, X)
 
-        M = np.hstack([cl.m_ for cl in self.rules])
+        if M is None:
+            M = np.hstack([cl.m_ for cl in self.rules])
 
         _, self.DX_ = X.shape
         _, self.Dy_ = y.shape
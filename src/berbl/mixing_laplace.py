@@ -37,10 +37,11 @@ class MixingLaplace(Mixing):
         self.DELTA_S_KLRG = DELTA_S_KLRG
         super().__init__(**kwargs)
 
-    def fit(self, X, y):
+    def fit(self, X, y, M=None):
         Phi = check_phi(self.phi, X)
 
-        M = np.hstack([rule.m_ for rule in self.rules])
+        if M is None:
+            M = np.hstack([rule.m_ for rule in self.rules])
 
         _, self.DX_ = X.shape
         _, self.Dy_ = y.shape
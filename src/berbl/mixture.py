@@ -2,7 +2,7 @@ from typing import *
 
 import numpy as np  # type: ignore
 
-from .utils import add_bias, check_phi, t
+from .utils import add_bias, check_phi, matching_matrix, t
 from .rule import Rule
 from .mixing import Mixing
 from .mixing_laplace import MixingLaplace
@@ -71,9 +71,21 @@ class Mixture:
         # “When fit is called, any previous call to fit should be ignored.”
         self.rules_ = list(map(lambda m: Rule(m, **self.__kwargs),
                                self.matchs))
+        # Since all the rules are fitted to the same data, we compute their
+        # matching-weighted sufficient statistics in one go (instead of each
+        # rule performing its own small matrix products on the whole data).
+        M = matching_matrix(self.matchs, X)
+        XtMX = np.einsum("nk,ni,nj->kij", M, X, X, optimize=True)
+        XtMy = np.einsum("nk,ni,nd->kid", M, X, y, optimize=True)
+        yMy = np.einsum("nk,nd,nd->k", M, y, y, optimize=True)
         # TODO Cache trained rules at the GA level.
         for k in range(self.K_):
-            self.rules_[k].fit(X, y)
+            self.rules_[k].fit_stats(X=X,
+                                     y=y,
+                                     m=M[:, [k]],
+                                     XtMX=XtMX[k],
+                                     XtMy=XtMy[k],
+                                     yMy=yMy[k])
 
         # Train mixing model.
         #
@@ -91,7 +103,7 @@ class Mixture:
         else:
             raise NotImplementedError(
                 "Only 'bouchard' and 'laplace' supported for fit_mixing")
-        self.mixing_.fit(X, y)
+        self.mixing_.fit(X, y, M=M)
 
         # We need to recalculate the rules' variational bounds here because we
         # now have access to the final value of R (which we substituted by M
@@ -1,4 +1,7 @@
+import math
+
 import numpy as np  # type: ignore
+import scipy.linalg as sl  # type: ignore
 import scipy.special as ss  # type: ignore
 
 
@@ -64,52 +67,121 @@ class Rule():
         See TrainClassifier [PDF p. 238].
         """
 
-        self.m_ = self.match.match(X)
+        m = self.match.match(X)
+
+        sqrt_m = np.sqrt(m)
+        # Data points that are not matched at all do not contribute to any of
+        # the sums below which is why we drop them beforehand (the matching
+        # functions in ``berbl.match`` never return exact zeros, but others
+        # may, e.g. crisp intervals).
+        matched = m.reshape((-1)) > 0
+        X_, y_ = X, y
+        if not np.all(matched):
+            X_, y_, sqrt_m = X[matched], y[matched], sqrt_m[matched]
+        X_ = X_ * sqrt_m
+        y_ = y_ * sqrt_m
 
-        N, self.DX_ = X.shape
-        N, self.Dy_ = y.shape
-        X_ = X * np.sqrt(self.m_)
-        y_ = y * np.sqrt(self.m_)
+        # Only the diagonal of Lambda changes within the variational loop; we
+        # can thus compute these products once beforehand.
+        return self.fit_stats(X=X,
+                              y=y,
+                              m=m,
+                              XtMX=X_.T @ X_,
+                              XtMy=X_.T @ y_,
+                              yMy=np.sum(y_ * y_))
+
+    def fit_stats(self, X: np.ndarray, y: np.ndarray, m: np.ndarray,
+                  XtMX: np.ndarray, XtMy: np.ndarray, yMy: float):
+        """
+        ``fit`` based on matching-weighted sufficient statistics of the data
+        (which are all that the variational updates require). This allows
+        callers that fit many rules on the same data (e.g. ``Mixture``) to
+        compute the matching matrix and these statistics for all of them at
+        once. The results are the same as the ones of ``fit`` if the given
+        statistics correspond to ``self.match``.
+
+        The data itself is still required for computing the sum of squared
+        residuals in the variational bound (expanding that sum in terms of the
+        statistics cancels catastrophically for well-fitting submodels).
+
+        Parameters
+        ----------
+        X : array of shape (N, DX)
+            Input matrix.
+        y : array of shape (N, Dy)
+            Output matrix.
+        m : array of shape (N, 1)
+            This rule's matching vector for the data.
+        XtMX : array of shape (DX, DX)
+            ``X.T @ (m * X)``.
+        XtMy : array of shape (DX, Dy)
+            ``X.T @ (m * y)``.
+        yMy : float
+            ``np.sum(m * y * y)``.
+        """
+        self.m_ = m
+        self.DX_, self.Dy_ = XtMy.shape
+        sum_m = np.sum(self.m_)
 
         E_alpha_alpha = self.A_ALPHA / self.B_ALPHA
         self.a_alpha_ = self.A_ALPHA + self.DX_ * self.Dy_ / 2
 
         # self.a_tau_ is constant.
-        self.a_tau_ = self.A_TAU + 0.5 * np.sum(self.m_)
+        self.a_tau_ = self.A_TAU + 0.5 * sum_m
         self.b_tau_ = self.B_TAU
 
         # TODO Why not precompute L_q_ using self.var_bound?
         self.L_q_ = -np.inf
         delta_L_q = self.DELTA_S_L_K_Q + 1
 
+        # Buffers reused throughout the variational loop.
+        self.Lambda_ = np.empty_like(XtMX)
+        I = np.identity(self.DX_)
+
         iter = 0
         while delta_L_q > self.DELTA_S_L_K_Q and iter < self.MAX_ITER_RULE:
             iter += 1
-            self.Lambda_ = np.diag([E_alpha_alpha] * self.DX_) + X_.T @ X_
-            # While, in theory, Lambda is always invertible here and we thus
-            # should be able to use inv (as it is described in the algorithm we
-            # implement), we (seldomly) get a singular matrix, probably due to
-            # numerical issues. Thus we simply use pinv which yields the same
-            # result as inv anyways if the matrix is in fact non-singular. Also,
-            # in his own code, Drugowitsch always uses pseudo inverse here.
-            self.Lambda_1_ = np.linalg.pinv(self.Lambda_)
-            self.W_ = y_.T @ X_ @ self.Lambda_1_
-            self.b_tau_ = self.B_TAU + 1 / (2 * self.Dy_) * (
-                np.sum(y_ * y_) - np.sum(self.W_ * (self.W_ @ self.Lambda_)))
+            np.copyto(self.Lambda_, XtMX)
+            self.Lambda_.flat[::self.DX_ + 1] += E_alpha_alpha
+            # Lambda is symmetric positive definite in theory which is why we
+            # solve for W using Lambda's Cholesky factor instead of multiplying
+            # by an explicit inverse (cheaper and numerically more stable).
+            # However, we (seldomly) get a numerically singular matrix here. In
+            # that case, we fall back to pinv which yields the same result as
+            # inv anyways if the matrix is in fact non-singular (in his own
+            # code, Drugowitsch always uses pseudo inverse here).
+            try:
+                L = np.linalg.cholesky(self.Lambda_)
+                self.Lambda_1_ = sl.cho_solve((L, True), I)
+                self.W_ = sl.cho_solve((L, True), XtMy).T
+                # ln |Lambda_1| = -ln |Lambda| = -2 ln |L|.
+                self.ln_det_Lambda_1_ = -2 * np.sum(np.log(np.diag(L)))
+            except np.linalg.LinAlgError:
+                self.Lambda_1_ = np.linalg.pinv(self.Lambda_)
+                self.W_ = XtMy.T @ self.Lambda_1_
+                self.ln_det_Lambda_1_ = np.linalg.slogdet(self.Lambda_1_)[1]
+            self.b_tau_ = self.B_TAU + 1 / (2 * self.Dy_) * (yMy - np.einsum(
+                "ij,jk,ik->", self.W_, self.Lambda_, self.W_))
             E_tau_tau = self.a_tau_ / self.b_tau_
             # Dy factor in front of trace due to sum over Dy elements (7.100).
-            self.b_alpha_ = self.B_ALPHA + 0.5 * (E_tau_tau * np.sum(
-                self.W_ * self.W_) + self.Dy_ * np.trace(self.Lambda_1_))
+            self.b_alpha_ = self.B_ALPHA + 0.5 * (
+                E_tau_tau * np.einsum("ij,ij->", self.W_, self.W_)
+                + self.Dy_ * np.trace(self.Lambda_1_))
             E_alpha_alpha = self.a_alpha_ / self.b_alpha_
             L_q_prev = self.L_q_
-            self.L_q_ = self.var_bound(
-                X=X,
-                y=y,
-                # Substitute r by m in order to train submodels independently
-                # (see [PDF p. 219]). Note, however, that after having trained
-                # the mixing model we finally evaluate the submodels using
-                # ``r=R[:,[k]]`` as intended.
-                r=self.m_)
+            # Substitute r by m in order to train submodels independently (see
+            # [PDF p. 219]). Note, however, that after having trained the
+            # mixing model we finally evaluate the submodels using
+            # ``r=R[:,[k]]`` as intended.
+            #
+            # sum_n m_n x_n^T Lambda_1 x_n = tr(Lambda_1 XtMX) is a sum of
+            # non-negative terms and can thus safely be computed from the
+            # statistics; the residuals, however, have to be computed directly.
+            sq_res = self.m_.reshape((-1)) @ np.sum(
+                (y - X @ self.W_.T)**2, axis=1)
+            L_2_q = -0.5 * (E_tau_tau * sq_res
+                            + self.Dy_ * np.sum(self.Lambda_1_ * XtMX))
+            self.L_q_ = self._var_bound(L_2_q=L_2_q, sum_r=sum_m)
             delta_L_q = self.L_q_ - L_q_prev
 
         return self
@@ -135,7 +207,8 @@ class Rule():
         kind of confidence estimate for the prediction.
 
         The model currently assumes the same variance in all dimensions; thus
-        the same value is repeated for each dimension.
+        the same value is repeated for each dimension (the returned array is a
+        read-only broadcast view, copy it before modifying it in-place).
 
         Parameters
         ----------
@@ -151,7 +224,7 @@ class Rule():
             (X @ self.Lambda_1_) * X, axis=1))
         # The same value is repeated for each dimension since the model
         # currently assumes the same variance in all dimensions.
-        return var[:, np.newaxis].repeat(self.Dy_, axis=1)
+        return np.broadcast_to(var[:, np.newaxis], (len(X), self.Dy_))
 
     def var_bound(self, X: np.ndarray, y: np.ndarray, r: np.ndarray):
         """
@@ -170,21 +243,64 @@ class Rule():
             this rule in order to enable independent submodel training).
         """
         E_tau_tau = self.a_tau_ / self.b_tau_
-        L_1_q = self.Dy_ / 2 * (ss.digamma(self.a_tau_) - np.log(self.b_tau_)
-                                - np.log(2 * np.pi)) * np.sum(r)
         # We reshape r to a NumPy row vector since NumPy seems to understand
         # what we want to do when we multiply two row vectors (i.e. a^T a).
         L_2_q = (-0.5 * r).reshape(
             (-1)) @ (E_tau_tau * np.sum((y - X @ self.W_.T)**2, axis=1)
                      + self.Dy_ * np.sum(X * (X @ self.Lambda_1_), axis=1))
-        L_3_q = -ss.gammaln(self.A_ALPHA) + self.A_ALPHA * np.log(
-            self.B_ALPHA) + ss.gammaln(self.a_alpha_) - self.a_alpha_ * np.log(
-                self.b_alpha_
-            ) + self.DX_ * self.Dy_ / 2 + self.Dy_ / 2 * np.log(
-                np.linalg.det(self.Lambda_1_))
-        L_4_q = self.Dy_ * (
-            -ss.gammaln(self.A_TAU) + self.A_TAU * np.log(self.B_TAU) +
-            (self.A_TAU - self.a_tau_) * ss.digamma(self.a_tau_)
-            - self.A_TAU * np.log(self.b_tau_) - self.B_TAU * E_tau_tau
-            + ss.gammaln(self.a_tau_) + self.a_tau_)
-        return L_1_q + L_2_q + L_3_q + L_4_q
+        return self._var_bound(L_2_q=L_2_q, sum_r=np.sum(r))
+
+    def _var_bound(self, L_2_q: float, sum_r: float):
+        """
+        ``var_bound`` given its data term ``L_2_q`` (which ``fit`` computes
+        partly based on the statistics it already has at hand).
+
+        Parameters
+        ----------
+        L_2_q : float
+            The responsibility-weighted data term of the bound.
+        sum_r : float
+            ``np.sum(r)``.
+        """
+        return _var_bound_scalar(A_ALPHA=self.A_ALPHA,
+                                 B_ALPHA=self.B_ALPHA,
+                                 A_TAU=self.A_TAU,
+                                 B_TAU=self.B_TAU,
+                                 a_alpha=self.a_alpha_,
+                                 b_alpha=self.b_alpha_,
+                                 a_tau=self.a_tau_,
+                                 b_tau=self.b_tau_,
+                                 DX=self.DX_,
+                                 Dy=self.Dy_,
+                                 ln_det_Lambda_1=self.ln_det_Lambda_1_,
+                                 sum_r=sum_r,
+                                 L_2_q=L_2_q)
+
+
+def _var_bound_scalar(A_ALPHA, B_ALPHA, A_TAU, B_TAU, a_alpha, b_alpha, a_tau,
+                      b_tau, DX, Dy, ln_det_Lambda_1, sum_r, L_2_q):
+    """
+    The purely scalar part of ``Rule.var_bound`` (i.e. everything but the data
+    term ``L_2_q``, which has to be given).
+
+    This is called once per variational update; we thus use the ``math``
+    module's functions which are a lot cheaper on Python scalars than NumPy's
+    and SciPy's ufuncs.
+    """
+    # If a rule fits outputs of large magnitude (almost) exactly, the updates of
+    # ``b_tau`` (and thus ``b_alpha``) may cancel to non-positive values for
+    # which the bound is undefined (``np.log`` would yield NaN here as well).
+    if b_tau <= 0 or b_alpha <= 0:
+        return np.nan
+
+    E_tau_tau = a_tau / b_tau
+    psi_a_tau = float(ss.digamma(a_tau))
+    L_1_q = Dy / 2 * (psi_a_tau - math.log(b_tau)
+                      - math.log(2 * math.pi)) * sum_r
+    L_3_q = (-math.lgamma(A_ALPHA) + A_ALPHA * math.log(B_ALPHA)
+             + math.lgamma(a_alpha) - a_alpha * math.log(b_alpha)
+             + DX * Dy / 2 + Dy / 2 * ln_det_Lambda_1)
+    L_4_q = Dy * (-math.lgamma(A_TAU) + A_TAU * math.log(B_TAU) +
+                  (A_TAU - a_tau) * psi_a_tau - A_TAU * math.log(b_tau)
+                  - B_TAU * E_tau_tau + math.lgamma(a_tau) + a_tau)
+    return L_1_q + L_2_q + L_3_q + L_4_q
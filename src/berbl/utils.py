@@ -1,3 +1,4 @@
+import math
 import random
 from functools import wraps
 from time import asctime, localtime, time
@@ -59,21 +60,34 @@ def get_ranges(X: np.ndarray):
     :returns: a ``(DX, 2)`` matrix where each row consists the minimum and
         maximum in the respective dimension
     """
-    return np.vstack([np.min(X, axis=0), np.max(X, axis=0)]).T
+    _, DX = X.shape
+    ranges = np.empty((DX, 2), dtype=X.dtype)
+    # Reduce directly into the result's columns instead of stacking and
+    # transposing two temporaries.
+    np.min(X, axis=0, out=ranges[:, 0])
+    np.max(X, axis=0, out=ranges[:, 1])
+    return ranges
 
 
-def add_bias(X: np.ndarray):
+def add_bias(X: np.ndarray, out: np.ndarray = None):
     """
     Prefixes each input vector (i.e. row) in the given input matrix with 1 for
     fitting the intercept.
 
     :param X: input data as an ``(N, DX)`` matrix
+    :param out: optional ``(N, DX + 1)`` buffer to write the result into (e.g.
+        in order to reuse it across calls); if ``None`` (the default), a new
+        one is allocated
 
     :returns: a ``(N, DX + 1)`` matrix where each row is the corresponding
         original matrix's row prefixed with 1
     """
     N, DX = X.shape
-    return np.hstack([np.ones((N, 1)), X])
+    if out is None:
+        out = np.empty((N, DX + 1), dtype=np.result_type(np.float64, X))
+    out[:, 0] = 1
+    out[:, 1:] = X
+    return out
 
 
 def pr_in_sd1(r=1):
@@ -111,34 +125,84 @@ def pr_in_sd(n=3, r=1):
     Reference for the used formulae:
     https://journals.plos.org/plosone/article?id=10.1371/journal.pone.0118537 .
 
+    Vectorized over ``n`` and ``r`` (which are broadcast against each other).
+
     Parameters
     ----------
-    n : positive int
+    n : positive int or array of positive ints
         Dimensionality of the Gaussian.
-    r : float greater than 1
+    r : float greater than 1 or array of such floats
         Factor for standard deviation radius. Numerical issues(?) if radius too
         close to zero. We probably never want require r < 1, though, so this is
         probably fine.
     """
+    # For scalar calls, iterating on Python floats is a lot cheaper than on 0-d
+    # arrays.
+    if np.isscalar(n) and np.isscalar(r):
+        return _pr_in_sd_scalar(n=n, r=r)
+
+    n, r = np.broadcast_arrays(np.asarray(n), np.asarray(r, dtype=float))
+
+    if np.any(r < 1):
+        raise ValueError(
+            f"r = {np.min(r)} < 1 may result in numerical issues")
+    if np.any(n < 1):
+        raise ValueError("n must be positive")
+    if np.any(n % 1 != 0):
+        raise ValueError("n must be an integer")
+
+    # Instead of recursing from n down to 1 or 2, we start at 1 or 2
+    # (depending on the parity of n) and iteratively subtract the terms for
+    # 3, 4, …, n, only updating the entries whose n has the same parity as the
+    # current term.
+    ci = np.where(n % 2 == 1, pr_in_sd1(r=r), pr_in_sd2(r=r))
+    # We compute the terms in log space to avoid overflows in gamma.
+    log_r_ = np.log(r / np.sqrt(2))
+    for k in range(3, int(np.max(n, initial=0)) + 1):
+        upd = (k <= n) & ((n - k) % 2 == 0)
+        ci = ci - upd * np.exp((k - 2) * log_r_ - r**2 / 2
+                               - sp.gammaln(k / 2))
+
+    # Slightly negative values are numerical noise from the subtractions above.
+    ci = np.where((ci < 0) & np.isclose(ci, 0), 0, ci)
+    if np.any(ci < 0):
+        raise ValueError(f"Numerical issues resulted in a negative "
+                         f"probability (min is {np.min(ci)}) for n = {n} and "
+                         f"r = {r}")
+
+    return ci[()]
+
+
+
+def _pr_in_sd_scalar(n, r):
+    """
+    ``pr_in_sd`` for scalar ``n`` and ``r``.
+    """
     if r < 1:
         raise ValueError(f"r = {r} < 1 may result in numerical issues")
-
-    if n == 1:
-        return pr_in_sd1(r=r)
-    elif n == 2:
-        return pr_in_sd2(r=r)
-    elif n >= 3:
-        ci = pr_in_sd(n=n - 2, r=r) - (r / np.sqrt(2))**(n - 2) * np.exp(
-            -(r**2) / 2) / sp.gamma(n / 2)
-        if ci < 0 and np.isclose(ci, 0):
-            return 0
-        else:
-            return ci
-    else:
+    if n < 1:
         raise ValueError("n must be positive")
+    if n % 1 != 0:
+        raise ValueError("n must be an integer")
+    n = int(n)
+
+    # See ``pr_in_sd``; only the terms with the same parity as n contribute.
+    ci = float(pr_in_sd1(r=r) if n % 2 == 1 else pr_in_sd2(r=r))
+    log_r_ = math.log(r / math.sqrt(2))
+    for k in range(4 - n % 2, n + 1, 2):
+        ci -= math.exp((k - 2) * log_r_ - r**2 / 2 - math.lgamma(k / 2))
 
+    # Slightly negative values are numerical noise from the subtractions above.
+    if ci < 0 and np.isclose(ci, 0):
+        ci = 0.
+    if ci < 0:
+        raise ValueError(f"Numerical issues resulted in a negative "
+                         f"probability ({ci}) for n = {n} and r = {r}")
 
-pr_in_sd_ = np.vectorize(pr_in_sd)
+    return ci
+
+# ``pr_in_sd`` is vectorized itself; this is kept for backwards compatibility.
+pr_in_sd_ = pr_in_sd
 
 
 def radius_for_ci(n=3, ci=0.5):
@@ -156,10 +220,30 @@ def radius_for_ci(n=3, ci=0.5):
 radius_for_ci_ = np.vectorize(radius_for_ci)
 
 
+def log_ball_vol(r: float, n: int):
+    """
+    Natural logarithm of the volume of an n-ball with the given radius.
+
+    Parameters
+    ----------
+    r : float
+        Radius.
+    n : int
+        Dimensionality.
+    """
+    # A radius of zero yields ``-inf`` (i.e. a volume of zero).
+    with np.errstate(divide="ignore"):
+        log_r = np.log(r)
+    return 0.5 * n * np.log(np.pi) - sp.gammaln(n / 2 + 1) + n * log_r
+
+
 def ball_vol(r: float, n: int):
     """
     Volume of an n-ball with the given radius.
 
+    Computed in log space so that we do not overflow in gamma for large ``n``
+    (see ``log_ball_vol``).
+
     Parameters
     ----------
     r : float
@@ -167,7 +251,7 @@ def ball_vol(r: float, n: int):
     n : int
         Dimensionality.
     """
-    return np.pi**(n / 2) / sp.gamma(n / 2 + 1) * r**n
+    return np.exp(log_ball_vol(r, n))
 
 
 def ellipsoid_vol(rs: np.ndarray, n: int):
@@ -181,11 +265,15 @@ def ellipsoid_vol(rs: np.ndarray, n: int):
     n : int
         Dimensionality.
     """
-    return np.pi**(n / 2) / sp.gamma(n / 2 + 1) * np.prod(rs)
+    # A radius of zero yields ``-inf`` (i.e. a volume of zero).
+    with np.errstate(divide="ignore"):
+        log_rs = np.log(rs)
+    return np.exp(0.5 * n * np.log(np.pi) - sp.gammaln(n / 2 + 1)
+                  + np.sum(log_rs))
 
 
 def ranges_vol(ranges):
-    return np.prod(np.diff(ranges))
+    return np.prod(ranges[:, 1] - ranges[:, 0])
 
 
 def space_vol(dim):
@@ -229,15 +317,31 @@ def check_phi(phi, X: np.ndarray):
     return Phi
 
 
-def matching_matrix(matchs: List, X: np.ndarray):
+def matching_matrix(matchs: List, X: np.ndarray, out: np.ndarray = None):
     """
-    :param ind: an individual for which the matching matrix is returned
+    :param matchs: matching functions (i.e. objects implementing a ``match``
+        method) for which the matching matrix is returned
     :param X: input matrix (N × DX)
+    :param out: optional matching matrix buffer (N × K) to write the result
+        into (e.g. in order to reuse it across calls); if ``None`` (the
+        default), a new one is allocated
 
     :returns: matching matrix (N × K)
     """
-    # TODO Can we maybe vectorize this?
-    return np.hstack([m.match(X) for m in matchs])
+    # Matching function families may know how to evaluate many of their
+    # members at once (see e.g. ``RadialMatch1D.match_batch``).
+    cls = type(matchs[0]) if len(matchs) > 0 else None
+    if hasattr(cls, "match_batch") and all(type(m) is cls for m in matchs):
+        return cls.match_batch(matchs, X, out=out)
+
+    # Otherwise, we can't vectorize across matching functions without knowing
+    # their form; we can, however, write each matching vector directly into
+    # its column instead of concatenating K temporaries.
+    if out is None:
+        out = np.empty((len(X), len(matchs)))
+    for k, m in enumerate(matchs):
+        out[:, k] = m.match(X).ravel()
+    return out
 
 
 def initRepeat_binom(container, func, n, p, random_state, kmin=1, kmax=100):
@@ -281,11 +385,16 @@ def t(mu, prec, df):
     callable
         A probability density function.
     """
+    # The normalization constant does not depend on X. We compute it in log
+    # space to avoid overflows in gamma for large degrees of freedom.
+    log_norm = sp.gammaln((df + 1) / 2) - sp.gammaln(df / 2) + 0.5 * np.log(
+        prec / (np.pi * df))
+
     def pdf(X):
-        # Repeat X so that we can perform vectorized calculation.
-        X = X[:,np.newaxis].repeat(len(mu),axis=1)
-        return sp.gamma((df + 1) / 2) / sp.gamma(df / 2) * np.sqrt(
-            prec / (np.pi * df)) * (1 + (prec *
-                                         (X - mu)**2) / df)**(-(df + 1) / 2)
+        # Broadcasting X against mu performs the vectorized calculation without
+        # having to repeat X.
+        X = X[:, np.newaxis]
+        return np.exp(log_norm - 0.5 * (df + 1) * np.log1p(prec *
+                                                           (X - mu)**2 / df))
 
     return pdf
@@ -159,3 +159,18 @@ def test_predict_batch_equals_point(matchs, X, y, X_test, random_state):
 
     assert np.all(np.isclose(y_pred_var,
                              y_pred_var_)), (y_pred_var - y_pred_var_)
+
+
+@given(st.lists(rmatch1ds(has_bias=True), min_size=2, max_size=10),
+       Xs(bias_column=False), ys(Dy=2), random_states())
+@settings(deadline=None)
+def test_predict_vars_multi_output_shape(matchs, X, y, random_state):
+    """
+    For multi-dimensional outputs, each submodel's prediction variance is
+    repeated for each output dimension.
+    """
+    model = Model(matchs, random_state=random_state).fit(X, y)
+
+    y_vars = model.predict_vars(X)
+    assert y_vars.shape == (len(matchs), len(X), 2)
+    assert np.all(y_vars == y_vars[:, :, [0]])
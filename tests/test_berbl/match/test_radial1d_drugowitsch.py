@@ -1,6 +1,8 @@
+import hypothesis.strategies as st  # type: ignore
 import numpy as np  # type: ignore
+from berbl.match.radial1d_drugowitsch import RadialMatch1D
 from hypothesis import given  # type: ignore
-from test_berbl import rmatch1ds, Xs_and_match1ds
+from test_berbl import Xs, rmatch1ds, Xs_and_match1ds
 
 
 @given(Xs_and_match1ds(rmatch1ds))
@@ -16,3 +18,14 @@ def test_match_prob_bounds(X_and_match1d):
     # All matching functions should match all samples, at least a little bit.
     assert np.all(0 < m)
     assert np.all(m <= 1)
+
+
+@given(st.booleans().flatmap(lambda has_bias: st.tuples(
+    Xs(bias_column=has_bias),
+    st.lists(rmatch1ds(has_bias=has_bias), min_size=1, max_size=10))))
+def test_match_batch_like_match(X_and_matchs):
+    X, matchs = X_and_matchs
+    M = RadialMatch1D.match_batch(matchs, X)
+    assert M.shape == (len(X), len(matchs))
+    for k in range(len(matchs)):
+        assert np.all(M[:, [k]] == matchs[k].match(X))
@@ -8,7 +8,7 @@ from hypothesis.extra.numpy import arrays  # type: ignore
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import mean_absolute_error
 from test_berbl import (Xs, assert_isclose, linears, noshrinking, random_data,
-                        ys)
+                        random_states, ys)
 
 # TODO Expand to n-dim radial matching. Currently this is only for
 # one-dimensional data (possibly with a bias column)
@@ -116,6 +116,19 @@ def test_predict_var_batch_equals_point(data):
                               rtol=1e-3), (y_var[n][j] - y_var_n_j)
 
 
+@given(Xs(), ys(Dy=3))
+def test_predict_var_multi_output_shape(X, y):
+    """
+    For multi-dimensional outputs, predict_var yields one (identical) variance
+    per output dimension.
+    """
+    cl = Rule(AllMatch()).fit(X, y)
+
+    y_var = cl.predict_var(X)
+    assert y_var.shape == (len(X), 3)
+    assert np.all(y_var == y_var[:, [0]])
+
+
 # DX = 5, N = 10
 @given(Xs(N=10, DX=5, bias_column=False),
        arrays(np.float64, (5, 5),
@@ -154,4 +167,44 @@ def test_fit_like_literal(data):
     assert_isclose(rule.b_alpha_, b_alpha_k, label="b_alpha_")
 
 
+@given(random_states())
+@settings(deadline=None, max_examples=15)
+def test_var_bound_large_y_like_literal(random_state):
+    """
+    The variational bound must not suffer from catastrophic cancellation if the
+    submodel fits outputs of large magnitude very well.
+    """
+    N = 500
+    x = random_state.uniform(-1, 1, size=(N, 1))
+    X = np.hstack([np.ones((N, 1)), x])
+    y = 1e4 * x + random_state.normal(0, 1e-3, size=(N, 1))
+
+    match = AllMatch()
+    rule = Rule(match).fit(X, y)
+
+    m = match.match(X)
+    L_q = literal.var_cl_bound(X, y, rule.W_, rule.Lambda_1_, rule.a_tau_,
+                               rule.b_tau_, rule.a_alpha_, rule.b_alpha_, m)
+
+    assert_isclose(rule.var_bound(X, y, m), L_q, label="var_bound")
+    assert_isclose(rule.L_q_, L_q, label="L_q_")
+
+
+@given(random_states())
+@settings(deadline=None, max_examples=15)
+def test_fit_noiseless_large_y(random_state):
+    """
+    Fitting outputs of large magnitude exactly may result in a non-positive
+    ``b_tau_`` due to cancellation; this must not break ``fit``.
+    """
+    N = 100
+    X = np.hstack([np.ones((N, 1)), random_state.uniform(-1, 1, size=(N, 1))])
+    w = random_state.uniform(-1, 1, size=(2, 1))
+    y = 1e6 * X @ w
+
+    rule = Rule(AllMatch()).fit(X, y)
+
+    assert np.all(np.isfinite(rule.W_))
+
+
 # TODO Add tests for all the other hyperparameters of Rule.
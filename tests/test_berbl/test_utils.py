@@ -1,7 +1,11 @@
 import hypothesis.strategies as st  # type: ignore
 import numpy as np  # type: ignore
+import pytest  # type: ignore
+from berbl.match.allmatch import AllMatch
 from hypothesis import given  # type: ignore
-from berbl.utils import pr_in_sd, radius_for_ci
+from berbl.utils import (ball_vol, ellipsoid_vol, log_ball_vol,
+                         matching_matrix, pr_in_sd, radius_for_ci)
+from test_berbl import Xs_and_match1ds, rmatch1ds
 
 
 @given(st.integers(min_value=1, max_value=100),
@@ -11,6 +15,33 @@ def test_pr_in_sd_is_pr(n, r):
     assert 0 <= ci <= 1
 
 
+@given(st.lists(st.integers(min_value=1, max_value=100), max_size=10),
+       st.floats(min_value=1, max_value=100))
+def test_pr_in_sd_vectorized_like_scalar(ns, r):
+    # Always include n = 1, 2 as well as mixed parities.
+    n = np.array([1, 2, 3, 4] + ns)
+    r = np.linspace(r, 2 * r, len(n))
+
+    ci = pr_in_sd(n, r)
+    assert ci.shape == n.shape
+    for i in range(len(n)):
+        assert np.isclose(ci[i], pr_in_sd(n[i], r[i]))
+        assert np.isclose(ci[i], pr_in_sd(float(n[i]), r[i]))
+
+
+def test_pr_in_sd_clamps_near_zero():
+    # For these, the subtractions in pr_in_sd result in (tiny) negative values
+    # for many of the n which have to be clamped to zero.
+    ci = pr_in_sd(np.arange(20, 201), 1.3)
+    assert np.all(ci >= 0)
+    assert np.any(ci == 0)
+
+
+def test_pr_in_sd_non_integer_n():
+    with pytest.raises(ValueError):
+        pr_in_sd(3.5, 2)
+
+
 @given(st.integers(min_value=1, max_value=100),
        st.floats(min_value=0.01, max_value=0.99))
 def test_radius_for_ci_finite(n, ci):
@@ -37,3 +68,35 @@ def test_radius_for_ci_inverse_pr_in_sd(nr):
                                 f"r' / r = {r_} / {r} = {r_ / r}")
 
 
+@given(Xs_and_match1ds(rmatch1ds))
+def test_matching_matrix_like_hstack(X_and_match1d):
+    X, match = X_and_match1d
+    matchs = [match, AllMatch(), match]
+
+    M = matching_matrix(matchs, X)
+    assert M.shape == (len(X), len(matchs))
+    assert np.all(M == np.hstack([m.match(X) for m in matchs]))
+
+    out = np.empty_like(M)
+    assert matching_matrix(matchs, X, out=out) is out
+    assert np.all(out == M)
+
+
+@given(st.floats(min_value=0.01, max_value=10))
+def test_ball_vol_low_dim(r):
+    assert np.isclose(ball_vol(r, 1), 2 * r)
+    assert np.isclose(ball_vol(r, 2), np.pi * r**2)
+    assert np.isclose(ball_vol(r, 3), 4 / 3 * np.pi * r**3)
+    assert np.isclose(ellipsoid_vol(np.repeat(r, 3), 3), ball_vol(r, 3))
+
+
+@given(st.integers(min_value=1, max_value=1000),
+       st.floats(min_value=0.01, max_value=10))
+def test_log_ball_vol_finite(n, r):
+    assert np.isfinite(log_ball_vol(r, n))
+
+
+def test_vol_zero_radius():
+    with np.errstate(all="raise"):
+        assert ball_vol(0., 3) == 0
+        assert ellipsoid_vol(np.array([1., 0., 2.]), 3) == 0